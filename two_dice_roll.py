@@ -1,45 +1,143 @@
-from typing import Dict, List, Optional, TypedDict, Literal
-import streamlit as st
-import random
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional, Tuple, TypedDict, Literal
+import json
+import os
+import re
 import time
-import pandas as pd
-import altair as alt
+import uuid
+import streamlit as st
+import numpy as np
+
+# pandas and altair are only needed once a game is running, so they are
+# imported lazily to keep the setup screen's cold start fast.
+if TYPE_CHECKING:
+    import altair as alt
+    import pandas as pd
 
 # =============================================================================
 # 1) Configuration and Types
 # =============================================================================
 
 
+_RNG = np.random.default_rng()
+
+# Below this many rolls the histogram is drawn with st.bar_chart.
+_SIMPLE_CHART_MAX_ROLLS = 20
+
+# Games are saved per session so they survive server restarts.
+_CACHE_DIR = Path(__file__).parent / ".saved_games"
+_CACHE_VERSION = 2
+# Saved games untouched for this long are treated as abandoned and deleted.
+_CACHE_MAX_AGE_SECONDS = 7 * 24 * 60 * 60
+_SESSION_KEY_PATTERN = re.compile(r"[A-Za-z0-9_-]{1,64}")
+
+
 class GameStateDict(TypedDict):
     """Type definition for the dictionary representation of GameState."""
 
     players: List[str]
     distribution: str
-    rolls_by_player: Dict[str, List[int]]
-    sum_counts: Dict[str, int]
+    rolls_values: List[int]
+    rolls_players: List[int]
+    sum_counts: List[int]
     current_player_index: int
 
 
+@dataclass(slots=True, eq=False)
 class GameState:
     """
     Represents the current state of the dice rolling game.
 
+    Rolls are stored column-wise: ``rolls_values[i]`` is the sum of the i-th
+    roll of the game and ``rolls_players[i]`` the index of the player who
+    rolled it. Both arrays grow geometrically, so only the first
+    ``num_rolls`` entries are meaningful.
+
     Attributes:
         players (List[str]): List of player names
         distribution (Literal["Real", "Uniform"]): Type of dice roll distribution
-        rolls_by_player (Dict[str, List[int]]): Dictionary mapping player names to their roll history
-        sum_counts (Dict[int, int]): Dictionary tracking frequency of each possible roll sum
+        rolls_values (np.ndarray): Sum of every roll, in chronological order
+        rolls_players (np.ndarray): Index into ``players`` of who made each roll
+        num_rolls (int): Number of rolls made so far
+        player_roll_counts (np.ndarray): Number of rolls made by each player
+        sum_counts (np.ndarray): Frequency of each possible roll sum, indexed by sum - 2
         current_player_index (int): Index of the current player in the players list
     """
 
-    def __init__(
-        self, players: List[str], distribution: Literal["Real", "Uniform"]
-    ) -> None:
-        self.players = players
-        self.distribution = distribution
-        self.rolls_by_player: Dict[str, List[int]] = {n: [] for n in players}
-        self.sum_counts: Dict[int, int] = {s: 0 for s in range(2, 13)}
-        self.current_player_index: int = 0
+    players: List[str]
+    distribution: Literal["Real", "Uniform"]
+    rolls_values: np.ndarray = field(
+        default_factory=lambda: np.empty(0, dtype=np.int8)
+    )
+    rolls_players: np.ndarray = field(
+        default_factory=lambda: np.empty(0, dtype=np.int8)
+    )
+    sum_counts: np.ndarray = field(
+        default_factory=lambda: np.zeros(11, dtype=np.int64)
+    )
+    current_player_index: int = 0
+    num_rolls: int = field(init=False)
+    player_roll_counts: np.ndarray = field(init=False)
+
+    def __post_init__(self) -> None:
+        rolls_values = np.asarray(self.rolls_values, dtype=np.int64)
+        rolls_players = np.asarray(self.rolls_players, dtype=np.int64)
+        if rolls_values.shape != rolls_players.shape or rolls_values.ndim != 1:
+            raise ValueError("rolls_values and rolls_players must have equal length")
+        if np.any((rolls_values < 2) | (rolls_values > 12)):
+            raise ValueError("rolls_values must be sums between 2 and 12")
+        if np.any((rolls_players < 0) | (rolls_players >= len(self.players))):
+            raise ValueError("rolls_players must index into players")
+        if not 0 <= self.current_player_index < len(self.players):
+            raise ValueError("current_player_index must index into players")
+
+        self.rolls_values = rolls_values.astype(np.int8)
+        self.rolls_players = rolls_players.astype(np.int8)
+        self.num_rolls = len(self.rolls_values)
+        self.player_roll_counts = np.bincount(
+            self.rolls_players, minlength=len(self.players)
+        )
+        self.sum_counts = np.asarray(self.sum_counts, dtype=np.int64)
+        if self.sum_counts.shape != (11,):
+            raise ValueError("sum_counts must hold 11 counts, one per sum 2..12")
+
+    def add_rolls(self, player_index: int, rolls: np.ndarray) -> None:
+        """
+        Record a batch of rolls made by one player.
+
+        Args:
+            player_index (int): Index into ``players`` of the player who rolled
+            rolls (np.ndarray): Roll sums to record, in order
+        """
+        end = self.num_rolls + len(rolls)
+        if end > len(self.rolls_values):
+            capacity = max(end, 2 * len(self.rolls_values), 16)
+            for name in ("rolls_values", "rolls_players"):
+                grown = np.empty(capacity, dtype=np.int8)
+                grown[: self.num_rolls] = getattr(self, name)[: self.num_rolls]
+                setattr(self, name, grown)
+
+        self.rolls_values[self.num_rolls : end] = rolls
+        self.rolls_players[self.num_rolls : end] = player_index
+        self.num_rolls = end
+        self.player_roll_counts[player_index] += len(rolls)
+        self.sum_counts += np.bincount(rolls, minlength=13)[2:]
+
+    def player_roll_count(self, player_index: int) -> int:
+        """
+        Count the rolls made so far by one player.
+
+        Args:
+            player_index (int): Index into ``players`` of the player
+
+        Returns:
+            int: Number of rolls made by that player
+        """
+        return int(self.player_roll_counts[player_index])
 
     @classmethod
     def from_dict(cls, data: GameStateDict) -> "GameState":
@@ -52,11 +150,7 @@ class GameState:
         Returns:
             GameState: New GameState instance initialized with the provided data
         """
-        game = cls(data["players"], data["distribution"])
-        game.rolls_by_player = data["rolls_by_player"]
-        game.sum_counts = {int(k): v for k, v in data["sum_counts"].items()}
-        game.current_player_index = data["current_player_index"]
-        return game
+        return cls(**data)
 
     def to_dict(self) -> GameStateDict:
         """
@@ -68,8 +162,9 @@ class GameState:
         return {
             "players": self.players,
             "distribution": self.distribution,
-            "rolls_by_player": self.rolls_by_player,
-            "sum_counts": self.sum_counts,
+            "rolls_values": self.rolls_values[: self.num_rolls].tolist(),
+            "rolls_players": self.rolls_players[: self.num_rolls].tolist(),
+            "sum_counts": self.sum_counts.tolist(),
             "current_player_index": self.current_player_index,
         }
 
@@ -79,6 +174,85 @@ class GameState:
 # =============================================================================
 
 
+def _session_key() -> str:
+    """
+    Return the key under which this session's game is saved.
+    The key is kept in the ``session`` query parameter so that reloading the
+    page (or reconnecting after a restart) finds the same saved game.
+
+    Returns:
+        str: Session key safe to use as a file name
+    """
+    key = st.query_params.get("session")
+    if key is None or not _SESSION_KEY_PATTERN.fullmatch(key):
+        key = uuid.uuid4().hex
+        st.query_params["session"] = key
+    return key
+
+
+def _persist(state: Optional[GameState], key: str) -> None:
+    """
+    Save the game state to disk, or remove the saved game if there is none.
+
+    Args:
+        state (Optional[GameState]): Game state to save, or None to clear it
+        key (str): Session key identifying the saved game
+    """
+    path = _CACHE_DIR / f"{key}.json"
+    if state is None:
+        path.unlink(missing_ok=True)
+        return
+
+    payload = {
+        "version": _CACHE_VERSION,
+        "timestamp": time.time(),
+        "state": state.to_dict(),
+    }
+    _CACHE_DIR.mkdir(exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(payload))
+    os.replace(tmp_path, path)
+
+
+def _prune_cache() -> None:
+    """
+    Delete saved games that have not been updated within _CACHE_MAX_AGE_SECONDS.
+    Only files written by _persist (``<session key>.json`` / ``.tmp``) are touched.
+    """
+    cutoff = time.time() - _CACHE_MAX_AGE_SECONDS
+    for path in _CACHE_DIR.glob("*"):
+        if path.suffix not in (".json", ".tmp"):
+            continue
+        if not _SESSION_KEY_PATTERN.fullmatch(path.stem):
+            continue
+        try:
+            if path.is_file() and path.stat().st_mtime < cutoff:
+                path.unlink()
+        except OSError:
+            pass
+
+
+def _restore(key: str) -> Optional[GameState]:
+    """
+    Load a previously saved game state from disk.
+
+    Args:
+        key (str): Session key identifying the saved game
+
+    Returns:
+        Optional[GameState]: The saved game state, or None if there is no
+            usable saved game
+    """
+    path = _CACHE_DIR / f"{key}.json"
+    try:
+        payload = json.loads(path.read_text())
+        if payload.get("version") != _CACHE_VERSION:
+            return None
+        return GameState.from_dict(payload["state"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
 def init_streamlit() -> None:
     """
     Initialize Streamlit application settings and session state variables.
@@ -92,15 +266,22 @@ def init_streamlit() -> None:
     )
 
     if "game_state" not in st.session_state:
-        st.session_state.game_state: Optional[GameState] = None
+        _prune_cache()
+        st.session_state.game_state: Optional[GameState] = _restore(_session_key())
     if "page" not in st.session_state:
-        st.session_state.page: Literal["setup", "game"] = "setup"
+        st.session_state.page: Literal["setup", "game"] = (
+            "game" if st.session_state.game_state else "setup"
+        )
+    if "rolls_df" not in st.session_state:
+        st.session_state.rolls_df: Optional[pd.DataFrame] = None
 
 
 def apply_custom_styles() -> None:
     """
     Apply custom CSS styles to the Streamlit application.
     Injects custom CSS to modify the appearance of various UI components.
+    Must run on every rerun: Streamlit drops any element that a rerun does not
+    emit again, so injecting the styles only once would lose them.
     """
     st.markdown(
         """
@@ -157,9 +338,23 @@ def roll_dice(distribution: Literal["Real", "Uniform"]) -> int:
     Returns:
         int: Sum of the dice roll
     """
+    return int(roll_dice_batch(distribution, 1)[0])
+
+
+def roll_dice_batch(distribution: Literal["Real", "Uniform"], n: int) -> np.ndarray:
+    """
+    Generate several dice rolls at once based on the selected distribution.
+
+    Args:
+        distribution (Literal["Real", "Uniform"]): Type of probability distribution to use
+        n (int): Number of rolls to generate
+
+    Returns:
+        np.ndarray: Array of ``n`` roll sums
+    """
     if distribution == "Uniform":
-        return random.randint(2, 12)
-    return random.randint(1, 6) + random.randint(1, 6)
+        return _RNG.integers(2, 13, size=n)
+    return _RNG.integers(1, 7, size=(n, 2)).sum(axis=1)
 
 
 def build_rolls_df(game_state: GameState) -> pd.DataFrame:
@@ -173,55 +368,113 @@ def build_rolls_df(game_state: GameState) -> pd.DataFrame:
         pd.DataFrame: DataFrame with players as columns and rolls as rows,
                      where empty slots are filled with None
     """
-    if not any(game_state.rolls_by_player.values()):
-        return pd.DataFrame()
-
-    chronological_data: Dict[str, List[Optional[int]]] = {
-        player: [] for player in game_state.players
-    }
-    total_rounds = max(len(rolls) for rolls in game_state.rolls_by_player.values())
-
-    for player in game_state.players:
-        player_rolls = game_state.rolls_by_player[player]
-        chronological_data[player] = player_rolls + [None] * (
-            total_rounds - len(player_rolls)
-        )
-
-    df = pd.DataFrame(chronological_data)
-    df.index = [f"Roll {i+1}" for i in range(total_rounds)]
-
-    return df
+    n = game_state.num_rolls
+    return _build_rolls_df(
+        tuple(game_state.players),
+        game_state.rolls_values[:n].tobytes(),
+        game_state.rolls_players[:n].tobytes(),
+    )
 
 
-def create_histogram(game_state: GameState) -> alt.Chart:
+@st.cache_data(max_entries=32)
+def _build_rolls_df(
+    players: Tuple[str, ...], rolls_values: bytes, rolls_players: bytes
+) -> pd.DataFrame:
     """
-    Create an Altair histogram visualization of dice roll frequencies.
+    Cached worker for build_rolls_df, keyed on hashable snapshots of the state.
 
     Args:
-        game_state (GameState): Current game state containing roll counts
+        players (Tuple[str, ...]): Player names in turn order
+        rolls_values (bytes): Raw int8 buffer of roll sums, in chronological order
+        rolls_players (bytes): Raw int8 buffer of the player index of each roll
 
     Returns:
-        alt.Chart: Altair chart object representing the histogram
+        pd.DataFrame: DataFrame with players as columns and rolls as rows
     """
-    df_counts = pd.DataFrame(
+    import pandas as pd
+
+    if not rolls_values:
+        return pd.DataFrame()
+
+    player_index = np.frombuffer(rolls_players, dtype=np.int8)
+    rolls = pd.DataFrame(
         {
-            "Sum": list(game_state.sum_counts.keys()),
-            "Count": list(game_state.sum_counts.values()),
+            "player": np.asarray(players)[player_index],
+            "value": np.frombuffer(rolls_values, dtype=np.int8),
         }
     )
+    rolls["round"] = rolls.groupby("player").cumcount() + 1
+
+    df = rolls.pivot(index="round", columns="player", values="value").reindex(
+        columns=list(players)
+    )
+    df.columns.name = None
+    df.index = pd.RangeIndex(1, len(df) + 1, name="Roll #")
+
+    return df
+
+
+@lru_cache(maxsize=None)
+def _base_histogram() -> alt.Chart:
+    """
+    Build the histogram chart template on first use.
+    The layout never changes; only its data is swapped in per render.
+
+    Returns:
+        alt.Chart: Altair chart with encodings and styling but no data
+    """
+    import altair as alt
+    import pandas as pd
+
     return (
-        alt.Chart(df_counts)
+        alt.Chart(pd.DataFrame({"Sum": [], "Count": []}))
         .mark_bar(color="#4531cc")
         .encode(
             x=alt.X("Sum:O", title="Dice Sum"),
             y=alt.Y("Count:Q", title="Frequency"),
-            tooltip=["Sum", "Count"],
+            tooltip=["Sum:O", "Count:Q"],
         )
         .properties(width=600, height=300)
         .configure_axis(labelFontSize=12, titleFontSize=14)
     )
 
 
+def create_histogram(game_state: GameState) -> alt.Chart:
+    """
+    Create an Altair histogram visualization of dice roll frequencies.
+
+    Args:
+        game_state (GameState): Current game state containing roll counts
+
+    Returns:
+        alt.Chart: Altair chart object representing the histogram
+    """
+    return _create_histogram(tuple(game_state.sum_counts.tolist()))
+
+
+@st.cache_data(max_entries=32)
+def _create_histogram(sum_counts: Tuple[int, ...]) -> alt.Chart:
+    """
+    Cached worker for create_histogram, keyed on a snapshot of the roll counts.
+
+    Args:
+        sum_counts (Tuple[int, ...]): Count of each roll sum from 2 to 12
+
+    Returns:
+        alt.Chart: Altair chart object representing the histogram
+    """
+    import altair as alt
+
+    return _base_histogram().properties(
+        data=alt.Data(
+            values=[
+                {"Sum": total, "Count": count}
+                for total, count in zip(range(2, 13), sum_counts)
+            ]
+        )
+    )
+
+
 # =============================================================================
 # 4) UI Screens
 # =============================================================================
@@ -267,45 +520,65 @@ def setup_screen() -> None:
                 return
 
             st.session_state.game_state = GameState(names, distribution)
+            _persist(st.session_state.game_state, _session_key())
+            st.session_state.rolls_df = None
             st.session_state.page = "game"
             st.rerun()
 
 
-def game_screen() -> None:
+@st.fragment
+def _roll_fragment(game_state: GameState) -> None:
     """
-    Render the main game screen.
-    Displays current player, roll button, roll history, and distribution visualization.
-    Handles dice rolling and updates game state accordingly.
+    Render the roll controls, distribution chart and roll history.
+    Runs as a Streamlit fragment so that rolling only reruns this section
+    instead of the whole script.
+
+    Args:
+        game_state (GameState): Current game state, updated in place on each roll
     """
-    game_state: Optional[GameState] = st.session_state.game_state
-    if not game_state:
-        st.error("Game state not found!")
-        if st.button("Return to Setup"):
-            st.session_state.page = "setup"
-            st.rerun()
-        return
+    import pandas as pd
 
-    st.title("🎲 Two Dice Roll")
-    st.info(f"Distribution: {game_state.distribution}")
+    rolls_df: pd.DataFrame = st.session_state.rolls_df
 
     current_player = game_state.players[game_state.current_player_index]
     st.markdown(f"### Current Turn: {current_player}")
 
+    num_rolls: int = st.number_input(
+        "Rolls this turn:",
+        min_value=1,
+        max_value=1000,
+        value=1,
+        step=1,
+    )
+
     if st.button("Roll Dice!", use_container_width=True):
-        with st.spinner("Rolling..."):
-            time.sleep(0.5)
-            roll_sum = roll_dice(game_state.distribution)
-            game_state.rolls_by_player[current_player].append(roll_sum)
-            game_state.sum_counts[roll_sum] += 1
-            game_state.current_player_index = (
-                game_state.current_player_index + 1
-            ) % len(game_state.players)
-            st.markdown(f"### 🎲 {current_player} rolled a {roll_sum}")
-
-    total_rolls: int = sum(len(rolls) for rolls in game_state.rolls_by_player.values())
+        rolls = roll_dice_batch(game_state.distribution, num_rolls)
+        player_index = game_state.current_player_index
+        first_roll = game_state.player_roll_count(player_index) + 1
+        game_state.add_rolls(player_index, rolls)
+        last_roll = first_roll + num_rolls - 1
+
+        if last_roll > len(rolls_df):
+            rolls_df = rolls_df.reindex(pd.RangeIndex(1, last_roll + 1, name="Roll #"))
+        rolls_df.loc[first_roll:last_roll, current_player] = rolls
+        st.session_state.rolls_df = rolls_df
+
+        game_state.current_player_index = (
+            game_state.current_player_index + 1
+        ) % len(game_state.players)
+        _persist(game_state, _session_key())
+        if num_rolls == 1:
+            st.markdown(f"### 🎲 {current_player} rolled a {int(rolls[0])}")
+        else:
+            st.markdown(f"### 🎲 {current_player} rolled {num_rolls} times")
+
+    total_rolls: int = game_state.num_rolls
 
     st.subheader("Distribution of Rolls")
-    if total_rolls > 0:
+    if 0 < total_rolls < _SIMPLE_CHART_MAX_ROLLS:
+        # Few rolls: Streamlit's built-in chart is cheaper than the styled one.
+        st.bar_chart(pd.Series(game_state.sum_counts, index=range(2, 13)))
+    elif total_rolls > 0:
         st.altair_chart(create_histogram(game_state), use_container_width=True)
     else:
         st.info("Roll some dice to see the distribution!")
@@ -314,7 +587,6 @@ def game_screen() -> None:
 
     with col1:
         st.subheader("Roll History")
-        rolls_df = build_rolls_df(game_state)
         if not rolls_df.empty:
             st.dataframe(rolls_df, use_container_width=True)
         else:
@@ -323,9 +595,38 @@ def game_screen() -> None:
     with col2:
         st.metric("Total Rolls", total_rolls)
 
+
+def game_screen() -> None:
+    """
+    Render the main game screen.
+    Displays current player, roll button, roll history, and distribution visualization.
+    Handles dice rolling and updates game state accordingly.
+    """
+    game_state: Optional[GameState] = st.session_state.game_state
+    if not game_state:
+        st.error("Game state not found!")
+        if st.button("Return to Setup"):
+            st.session_state.page = "setup"
+            st.rerun()
+        return
+
+    st.title("🎲 Two Dice Roll")
+    st.info(f"Distribution: {game_state.distribution}")
+
+    # The roll history table is maintained incrementally; rebuild it from the
+    # game state only when it is missing (a new game or a restored one).
+    if st.session_state.rolls_df is None:
+        st.session_state.rolls_df = build_rolls_df(game_state).reindex(
+            columns=game_state.players
+        )
+
+    _roll_fragment(game_state)
+
     st.write("---")
     if st.button("Reset Game"):
         st.session_state.game_state = None
+        st.session_state.rolls_df = None
+        _persist(None, _session_key())
         st.session_state.page = "setup"
         st.rerun()
 